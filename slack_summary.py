@@ -7,12 +7,15 @@ a daily summary of Slack activity.
 """
 
 import argparse
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Optional, TextIO
 
 from src.config import get_config
-from src.slack_client import SlackClient
-from src.summarizer import format_summary_markdown, summarize_workspace
+from src.slack_client import get_client
+from src.summarizer import format_relative_time, format_summary_markdown, summarize_workspace, truncate_text
 
 
 def main():
@@ -82,62 +85,62 @@ Examples:
 
     print(f"Fetching Slack activity from last {args.hours} hours...", file=sys.stderr)
 
-    summaries = []
-    for ws in workspaces:
+    def process(ws):
         print(f"  Processing {ws.name}...", file=sys.stderr)
-        client = SlackClient(workspace=ws)
-        summary = summarize_workspace(client, hours=args.hours)
-        summaries.append(summary)
-
-    # Generate markdown
-    if args.action_items_only:
-        # Custom format for action items only
-        output = generate_action_items_only(summaries)
-    else:
-        output = format_summary_markdown(summaries)
+        client = get_client(ws.key)
+        return summarize_workspace(client, hours=args.hours)
+
+    # Workspaces are independent and network-bound, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(workspaces), 8)) as executor:
+        summaries = list(executor.map(process, workspaces))
+
+    # Generate markdown (custom format for action items only)
+    render = generate_action_items_only if args.action_items_only else format_summary_markdown
 
-    # Write output
+    # Stream the markdown straight to its destination
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(output)
+        with open(args.output, "w", buffering=1 << 16) as f:
+            render(summaries, out=f)
         print(f"Summary written to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        render(summaries, out=sys.stdout)
+
+
+def generate_action_items_only(summaries, out: Optional[TextIO] = None) -> Optional[str]:
+    """Generate a summary showing only action items.
 
+    Writes to ``out`` if given, otherwise returns the markdown as a string.
+    """
+    buf = out if out is not None else io.StringIO()
+    w = buf.write
 
-def generate_action_items_only(summaries):
-    """Generate a summary showing only action items."""
     now = datetime.now(timezone.utc)
-    lines = [
-        f"# Slack Action Items - {now.strftime('%B %d, %Y')}",
-        "",
-    ]
+    w(f"# Slack Action Items - {now.strftime('%B %d, %Y')}\n\n")
 
     has_items = False
     for ws in summaries:
         if ws.action_items:
             has_items = True
             if len(summaries) > 1:
-                lines.append(f"## {ws.name}")
-                lines.append("")
+                w(f"## {ws.name}\n\n")
 
-            lines.append("| From | Channel | Message | Time |")
-            lines.append("|------|---------|---------|------|")
+            w("| From | Channel | Message | Time |\n")
+            w("|------|---------|---------|------|\n")
 
-            from src.summarizer import truncate_text, format_relative_time
             for msg in ws.action_items:
                 from_name = msg.user_name or "Unknown"
                 text = truncate_text(msg.text, 60)
-                time_str = format_relative_time(msg.timestamp)
-                lines.append(f"| {from_name} | {msg.channel_name} | {text} | {time_str} |")
+                time_str = format_relative_time(msg.timestamp, now)
+                w(f"| {from_name} | {msg.channel_name} | {text} | {time_str} |\n")
 
-            lines.append("")
+            w("\n")
 
     if not has_items:
-        lines.append("No action items requiring your attention.")
-        lines.append("")
+        w("No action items requiring your attention.\n\n")
 
-    return "\n".join(lines)
+    if out is None:
+        return buf.getvalue()
+    return None
 
 
 if __name__ == "__main__":
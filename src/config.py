@@ -1,11 +1,18 @@
 """Configuration management for multi-workspace Slack support."""
 
-import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+
+# Environment variables of the form SLACK_TOKEN_<name> define workspaces
+TOKEN_ENV_PREFIX = "SLACK_TOKEN_"
+
 
 @dataclass
 class WorkspaceConfig:
@@ -21,6 +28,10 @@ class Config:
     """Global configuration with all workspaces."""
     workspaces: dict[str, WorkspaceConfig]
     default_workspace: Optional[str] = None
+    _sorted: list[WorkspaceConfig] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._sorted = sorted(self.workspaces.values(), key=lambda w: w.priority)
 
     def get_workspace(self, key: Optional[str] = None) -> WorkspaceConfig:
         """Get a workspace by key, or the default."""
@@ -35,7 +46,7 @@ class Config:
 
     def list_workspaces(self) -> list[WorkspaceConfig]:
         """List all workspaces sorted by priority."""
-        return sorted(self.workspaces.values(), key=lambda w: w.priority)
+        return self._sorted
 
 
 def load_config() -> Config:
@@ -44,7 +55,8 @@ def load_config() -> Config:
 
     Priority:
     1. Config file at ~/.config/slack-mcp/config.json
-    2. Environment variables (SLACK_TOKEN_* pattern)
+    2. Environment variables (SLACK_TOKEN_* pattern), used only if the
+       config file defines no workspaces or SLACK_MCP_MERGE_ENV is 1/true/yes
     3. Single SLACK_USER_TOKEN environment variable
     """
     workspaces: dict[str, WorkspaceConfig] = {}
@@ -52,9 +64,8 @@ def load_config() -> Config:
 
     # Try config file first - use ~/.mcp-auth/slack/ to match other MCP servers
     config_path = Path.home() / ".mcp-auth" / "slack" / "config.json"
-    if config_path.exists():
-        with open(config_path) as f:
-            data = json.load(f)
+    if config_path.is_file():
+        data = _json_loads(config_path.read_bytes())
 
         for key, ws_data in data.get("workspaces", {}).items():
             workspaces[key] = WorkspaceConfig(
@@ -65,15 +76,22 @@ def load_config() -> Config:
             )
         default_workspace = data.get("default_workspace")
 
-    # Check for SLACK_TOKEN_* environment variables
-    for key, value in os.environ.items():
-        if key.startswith("SLACK_TOKEN_") and key != "SLACK_TOKEN_":
-            ws_key = key[12:].lower()  # Remove SLACK_TOKEN_ prefix
+    # Check for SLACK_TOKEN_* environment variables. The config file is
+    # authoritative, so only merge them in if it defined no workspaces or
+    # SLACK_MCP_MERGE_ENV is enabled.
+    if not workspaces or os.environ.get("SLACK_MCP_MERGE_ENV", "").strip().lower() in ("1", "true", "yes"):
+        prefix_len = len(TOKEN_ENV_PREFIX)
+        env_tokens = {
+            key[prefix_len:].lower(): value
+            for key, value in os.environ.items()
+            if key.startswith(TOKEN_ENV_PREFIX) and len(key) > prefix_len
+        }
+        for ws_key, token in env_tokens.items():
             if ws_key not in workspaces:
                 workspaces[ws_key] = WorkspaceConfig(
                     key=ws_key,
                     name=ws_key.replace("_", " ").title(),
-                    token=value,
+                    token=token,
                     priority=len(workspaces) + 1,
                 )
 
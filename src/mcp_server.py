@@ -1,8 +1,20 @@
 """MCP server for Slack integration."""
 
+import asyncio
+import functools
+import io
 import json
+import os
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime, timezone
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -11,299 +23,337 @@ from mcp.types import (
 )
 
 from .config import get_config
-from .slack_client import SlackClient
-from .summarizer import format_summary_markdown, summarize_workspace, quick_summary, truncate_text, format_relative_time
+from .slack_client import SlackClient, get_all_clients, get_client
+from .summarizer import format_summary_markdown, summarize_workspace_async, quick_summary, truncate_text, format_relative_time
 
 # Initialize MCP server
 server = Server("slack-mcp")
 
-# Lazy-loaded clients per workspace
-_clients: dict[str, SlackClient] = {}
-
-
-def get_client(workspace: str | None = None) -> SlackClient:
-    """Get or create a Slack client for a workspace."""
-    config = get_config()
-    ws = config.get_workspace(workspace)
-
-    if ws.key not in _clients:
-        _clients[ws.key] = SlackClient(workspace=ws)
-
-    return _clients[ws.key]
-
-
-def get_all_clients() -> list[SlackClient]:
-    """Get clients for all configured workspaces."""
-    config = get_config()
-    clients = []
-    for ws in config.list_workspaces():
-        if ws.key not in _clients:
-            _clients[ws.key] = SlackClient(workspace=ws)
-        clients.append(_clients[ws.key])
-    return clients
-
-
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Slack tools."""
-    return [
-        # Read tools
-        Tool(
-            name="slack_workspaces",
-            description="List all configured Slack workspaces",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-            },
-        ),
-        Tool(
-            name="slack_summary",
-            description="Get a summary of Slack activity (DMs, mentions, channels). Use 'quick' mode for fast overview, 'full' for detailed scan.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mode": {
-                        "type": "string",
-                        "description": "'quick' (fast, just recent activity) or 'full' (slower, detailed scan). Default: quick",
-                        "default": "quick",
-                    },
-                    "hours": {
-                        "type": "number",
-                        "description": "Number of hours to look back (default: 24, max recommended: 168 for week)",
-                        "default": 24,
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Specific workspace to summarize (optional, defaults to all)",
-                    },
-                },
-                "required": [],
+# Max workspaces queried at once when fanning out across all workspaces
+# (at least 1; an unparseable value falls back to the default)
+try:
+    MAX_CONCURRENT_REQUESTS = max(1, int(os.environ.get("SLACK_MAX_CONCURRENT_REQUESTS", "8")))
+except ValueError:
+    MAX_CONCURRENT_REQUESTS = 8
+
+# Per-message output templates for the read tools
+_CHANNEL_MESSAGE_TPL = "[{time}] **{user}**{thread_info}: {text}\n  _ts: {ts}_\n\n"
+_DM_MESSAGE_TPL = "[{time}] **{user}**: {text}\n  _ts: {ts}_\n\n"
+_THREAD_MESSAGE_TPL = "[{time}] **{user}**: {text}\n\n"
+_SEARCH_RESULT_TPL = "**{channel}** - {user} ({time})\n  {text}\n  _ts: {ts}_\n\n"
+
+# Flattens message text onto a single line (newlines, carriage returns, tabs)
+_FLATTEN = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
+async def _gather_for_clients(func, clients: list[SlackClient], **kwargs) -> list:
+    """Await an async per-workspace function for each client, MAX_CONCURRENT_REQUESTS at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def run(client: SlackClient):
+        async with semaphore:
+            return await func(client, **kwargs)
+
+    return await asyncio.gather(*(run(c) for c in clients))
+
+
+async def _run_for_clients(func, clients: list[SlackClient], **kwargs) -> list:
+    """Run a blocking per-workspace function for each client concurrently."""
+    return await _gather_for_clients(functools.partial(asyncio.to_thread, func), clients, **kwargs)
+
+
+def _wants_json(args: dict[str, Any]) -> bool:
+    """Whether the caller asked for structured JSON instead of markdown."""
+    return args.get("format") == "json"
+
+
+def _to_json(payload: Any) -> str:
+    """Serialize a structured tool result (datetimes become strings)."""
+    if orjson is not None:
+        # Pass datetimes through to str() so output matches the json fallback
+        return orjson.dumps(payload, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+    return json.dumps(payload, default=str)
+
+
+# Output format option shared by the read tools
+_FORMAT_PROPERTY = {
+    "type": "string",
+    "description": "'markdown' (default) or 'json' for structured data",
+    "default": "markdown",
+}
+
+# Tool definitions are static, so build them once
+_TOOLS: list[Tool] = [
+    # Read tools
+    Tool(
+        name="slack_workspaces",
+        description="List all configured Slack workspaces",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="slack_summary",
+        description="Get a summary of Slack activity (DMs, mentions, channels). Use 'quick' mode for fast overview, 'full' for detailed scan.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mode": {
+                    "type": "string",
+                    "description": "'quick' (fast, just recent activity) or 'full' (slower, detailed scan). Default: quick. JSON output always uses a full scan",
+                    "default": "quick",
+                },
+                "hours": {
+                    "type": "number",
+                    "description": "Number of hours to look back (default: 24, max recommended: 168 for week)",
+                    "default": 24,
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Specific workspace to summarize (optional, defaults to all)",
+                },
             },
-        ),
-        Tool(
-            name="slack_unread",
-            description="Get unread messages from DMs and key channels",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hours": {
-                        "type": "number",
-                        "description": "Hours to look back (default: 24)",
-                        "default": 24,
-                    },
-                    "max_dms": {
-                        "type": "number",
-                        "description": "Max DM conversations to check (default: 15)",
-                        "default": 15,
-                    },
-                    "max_channels": {
-                        "type": "number",
-                        "description": "Max channels to check (default: 15)",
-                        "default": 15,
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Specific workspace (optional)",
-                    },
-                },
-                "required": [],
+            "required": [],
+        },
+    ),
+    Tool(
+        name="slack_unread",
+        description="Get unread messages from DMs and key channels",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hours": {
+                    "type": "number",
+                    "description": "Hours to look back (default: 24)",
+                    "default": 24,
+                },
+                "max_dms": {
+                    "type": "number",
+                    "description": "Max DM conversations to check (default: 15)",
+                    "default": 15,
+                },
+                "max_channels": {
+                    "type": "number",
+                    "description": "Max channels to check (default: 15)",
+                    "default": 15,
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Specific workspace (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_channel",
-            description="Read recent messages from a specific channel",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel name (e.g., #general) or ID",
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of messages to fetch (default: 20)",
-                        "default": 20,
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["channel"],
+            "required": [],
+        },
+    ),
+    Tool(
+        name="slack_channel",
+        description="Read recent messages from a specific channel",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel": {
+                    "type": "string",
+                    "description": "Channel name (e.g., #general) or ID",
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Number of messages to fetch (default: 20)",
+                    "default": 20,
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_dm",
-            description="Read recent messages from a DM conversation with a specific person",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "person": {
-                        "type": "string",
-                        "description": "Person's name (e.g., 'Jen Rexford', 'jen', '@jennifer')",
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of messages to fetch (default: 20)",
-                        "default": 20,
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["person"],
+            "required": ["channel"],
+        },
+    ),
+    Tool(
+        name="slack_dm",
+        description="Read recent messages from a DM conversation with a specific person",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "person": {
+                    "type": "string",
+                    "description": "Person's name (e.g., 'Jen Rexford', 'jen', '@jennifer')",
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Number of messages to fetch (default: 20)",
+                    "default": 20,
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_thread",
-            description="Read messages in a specific thread",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel name or ID",
-                    },
-                    "thread_ts": {
-                        "type": "string",
-                        "description": "Thread timestamp (the ts of the parent message)",
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["channel", "thread_ts"],
+            "required": ["person"],
+        },
+    ),
+    Tool(
+        name="slack_thread",
+        description="Read messages in a specific thread",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel": {
+                    "type": "string",
+                    "description": "Channel name or ID",
+                },
+                "thread_ts": {
+                    "type": "string",
+                    "description": "Thread timestamp (the ts of the parent message)",
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_search",
-            description="Search for messages across Slack",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (supports Slack search syntax)",
-                    },
-                    "count": {
-                        "type": "number",
-                        "description": "Number of results (default: 20)",
-                        "default": 20,
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["query"],
+            "required": ["channel", "thread_ts"],
+        },
+    ),
+    Tool(
+        name="slack_search",
+        description="Search for messages across Slack",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (supports Slack search syntax)",
+                },
+                "count": {
+                    "type": "number",
+                    "description": "Number of results (default: 20)",
+                    "default": 20,
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_channels",
-            description="List all channels you're a member of",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {
-                        "type": "string",
-                        "description": "Filter by type: 'all', 'channels', 'dms', 'groups' (default: 'channels')",
-                        "default": "channels",
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": [],
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="slack_channels",
+        description="List all channels you're a member of",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {
+                    "type": "string",
+                    "description": "Filter by type: 'all', 'channels', 'dms', 'groups' (default: 'channels')",
+                    "default": "channels",
+                },
+                "format": _FORMAT_PROPERTY,
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        # Write tools
-        Tool(
-            name="slack_send",
-            description="Send a message to a channel or DM. If replying to a specific message (not the most recent), provide reply_to_ts to auto-add context.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel name (#channel), user (@username), or ID",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Message text to send",
-                    },
-                    "reply_to_ts": {
-                        "type": "string",
-                        "description": "Timestamp of message being replied to (adds context if not most recent)",
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["channel", "text"],
+            "required": [],
+        },
+    ),
+    # Write tools
+    Tool(
+        name="slack_send",
+        description="Send a message to a channel or DM. If replying to a specific message (not the most recent), provide reply_to_ts to auto-add context.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel": {
+                    "type": "string",
+                    "description": "Channel name (#channel), user (@username), or ID",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Message text to send",
+                },
+                "reply_to_ts": {
+                    "type": "string",
+                    "description": "Timestamp of message being replied to (adds context if not most recent)",
+                },
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_reply",
-            description="Reply to a message in a thread. If replying to a specific message in the thread (not the most recent), provide reply_to_ts to auto-add context.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel name or ID",
-                    },
-                    "thread_ts": {
-                        "type": "string",
-                        "description": "Timestamp of the parent message (thread root)",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Reply text",
-                    },
-                    "reply_to_ts": {
-                        "type": "string",
-                        "description": "Timestamp of specific message being replied to (adds context if not most recent in thread)",
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["channel", "thread_ts", "text"],
+            "required": ["channel", "text"],
+        },
+    ),
+    Tool(
+        name="slack_reply",
+        description="Reply to a message in a thread. If replying to a specific message in the thread (not the most recent), provide reply_to_ts to auto-add context.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel": {
+                    "type": "string",
+                    "description": "Channel name or ID",
+                },
+                "thread_ts": {
+                    "type": "string",
+                    "description": "Timestamp of the parent message (thread root)",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Reply text",
+                },
+                "reply_to_ts": {
+                    "type": "string",
+                    "description": "Timestamp of specific message being replied to (adds context if not most recent in thread)",
+                },
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-        Tool(
-            name="slack_react",
-            description="Add an emoji reaction to a message",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "channel": {
-                        "type": "string",
-                        "description": "Channel name or ID",
-                    },
-                    "timestamp": {
-                        "type": "string",
-                        "description": "Message timestamp",
-                    },
-                    "emoji": {
-                        "type": "string",
-                        "description": "Emoji name (e.g., 'thumbsup', 'eyes', 'white_check_mark')",
-                    },
-                    "workspace": {
-                        "type": "string",
-                        "description": "Workspace key (optional)",
-                    },
-                },
-                "required": ["channel", "timestamp", "emoji"],
+            "required": ["channel", "thread_ts", "text"],
+        },
+    ),
+    Tool(
+        name="slack_react",
+        description="Add an emoji reaction to a message",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel": {
+                    "type": "string",
+                    "description": "Channel name or ID",
+                },
+                "timestamp": {
+                    "type": "string",
+                    "description": "Message timestamp",
+                },
+                "emoji": {
+                    "type": "string",
+                    "description": "Emoji name (e.g., 'thumbsup', 'eyes', 'white_check_mark')",
+                },
+                "workspace": {
+                    "type": "string",
+                    "description": "Workspace key (optional)",
+                },
             },
-        ),
-    ]
+            "required": ["channel", "timestamp", "emoji"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Slack tools."""
+    return _TOOLS
 
 
 @server.call_tool()
@@ -316,235 +366,305 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error: {e}")]
 
 
-async def _handle_tool(name: str, args: dict[str, Any]) -> str:
-    """Route tool calls to handlers."""
+async def _tool_slack_workspaces(args: dict[str, Any]) -> str:
+    """List configured workspaces."""
+    config = get_config()
+    workspaces = config.list_workspaces()
+    buf = io.StringIO()
+    w = buf.write
+    w("Configured Slack workspaces:\n\n")
+    for ws in workspaces:
+        default_marker = " (default)" if ws.key == config.default_workspace else ""
+        w(f"- **{ws.key}**: {ws.name}{default_marker}\n")
+    return buf.getvalue()
+
+
+async def _tool_slack_summary(args: dict[str, Any]) -> str:
+    """Summarize recent activity in one or all workspaces."""
     workspace = args.get("workspace")
-
-    if name == "slack_workspaces":
-        config = get_config()
-        workspaces = config.list_workspaces()
-        lines = ["Configured Slack workspaces:", ""]
-        for ws in workspaces:
-            default_marker = " (default)" if ws.key == config.default_workspace else ""
-            lines.append(f"- **{ws.key}**: {ws.name}{default_marker}")
-        return "\n".join(lines)
-
-    elif name == "slack_summary":
-        hours = args.get("hours", 24)
-        mode = args.get("mode", "quick")
-
-        if mode == "quick":
-            # Fast mode - just recent activity
-            if workspace:
-                client = get_client(workspace)
-                return quick_summary(client, hours=hours)
-            else:
-                clients = get_all_clients()
-                results = [quick_summary(c, hours=hours) for c in clients]
-                return "\n\n---\n\n".join(results)
+    hours = args.get("hours", 24)
+    mode = args.get("mode", "quick")
+
+    if mode == "quick" and not _wants_json(args):
+        # Fast mode - just recent activity
+        clients = [get_client(workspace)] if workspace else get_all_clients()
+        results = await _run_for_clients(quick_summary, clients, hours=hours)
+        return "\n\n---\n\n".join(results)
+    else:
+        # Full mode - detailed scan
+        clients = [get_client(workspace)] if workspace else get_all_clients()
+        summaries = await _gather_for_clients(summarize_workspace_async, clients, hours=hours)
+        if _wants_json(args):
+            return _to_json({"summaries": [asdict(s) for s in summaries]})
+        return format_summary_markdown(summaries)
+
+
+async def _tool_slack_unread(args: dict[str, Any]) -> str:
+    """List unread messages from DMs and key channels."""
+    client = get_client(args.get("workspace"))
+    hours = args.get("hours", 24)
+    max_dms = args.get("max_dms", 15)
+    max_channels = args.get("max_channels", 15)
+
+    unread = await client.get_unread_messages_async(hours=hours, max_dms=max_dms, max_channels=max_channels)
+
+    if _wants_json(args):
+        return _to_json({"unread": {name: [asdict(m) for m in msgs] for name, msgs in unread.items()}})
+
+    if not unread:
+        return "No unread messages."
+
+    buf = io.StringIO()
+    w = buf.write
+    w("Unread messages:\n\n")
+    now = datetime.now(timezone.utc)
+    for channel_name, messages in unread.items():
+        w(f"**{channel_name}** ({len(messages)} messages)\n")
+        for msg in messages[:3]:
+            preview = truncate_text(msg.text, 60)
+            time_str = format_relative_time(msg.timestamp, now)
+            user = msg.user_name or "someone"
+            w(f"  - [{user}] {time_str}: \"{preview}\"\n")
+        if len(messages) > 3:
+            w(f"  - ... and {len(messages) - 3} more\n")
+        w("\n")
+
+    return buf.getvalue()
+
+
+async def _tool_slack_channel(args: dict[str, Any]) -> str:
+    """Read recent messages from a channel."""
+    client = get_client(args.get("workspace"))
+    channel = args["channel"]
+    limit = args.get("limit", 20)
+
+    channel_id = client._resolve_channel(channel)
+    messages = client.get_messages(channel_id, limit=limit, use_cache=False)  # Always current
+
+    if _wants_json(args):
+        return _to_json({"channel": channel, "channel_id": channel_id, "messages": [asdict(m) for m in messages]})
+
+    if not messages:
+        return f"No messages in {channel}."
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Recent messages in {channel}:\n\n")
+    now = datetime.now(timezone.utc)
+    for msg in messages:
+        thread_info = f" (thread: {msg.reply_count} replies)" if msg.reply_count > 0 else ""
+        w(_CHANNEL_MESSAGE_TPL.format(
+            time=format_relative_time(msg.timestamp, now),
+            user=msg.user_name or "Unknown",
+            thread_info=thread_info,
+            text=msg.text.translate(_FLATTEN),
+            ts=msg.ts,
+        ))
+
+    return buf.getvalue()
+
+
+async def _tool_slack_dm(args: dict[str, Any]) -> str:
+    """Read recent messages from a DM with a person."""
+    client = get_client(args.get("workspace"))
+    person = args["person"]
+    limit = args.get("limit", 20)
+
+    channel_id, resolved_name = client.find_dm_by_person(person)
+    messages = client.get_messages(channel_id, limit=limit, use_cache=False)  # Always current
+
+    if _wants_json(args):
+        return _to_json({"person": resolved_name, "channel_id": channel_id, "messages": [asdict(m) for m in messages]})
+
+    if not messages:
+        return f"No messages with {resolved_name}."
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"DM conversation with {resolved_name}:\n\n")
+    now = datetime.now(timezone.utc)
+    my_user_id = client.my_user_id
+    for msg in messages:
+        # Determine if this is from the other person or me
+        if msg.user_id == my_user_id:
+            sender = "You"
         else:
-            # Full mode - detailed scan
-            if workspace:
-                client = get_client(workspace)
-                summaries = [summarize_workspace(client, hours=hours)]
-            else:
-                clients = get_all_clients()
-                summaries = [summarize_workspace(c, hours=hours) for c in clients]
-            return format_summary_markdown(summaries)
-
-    elif name == "slack_unread":
-        client = get_client(workspace)
-        hours = args.get("hours", 24)
-        max_dms = args.get("max_dms", 15)
-        max_channels = args.get("max_channels", 15)
-
-        unread = client.get_unread_messages(hours=hours, max_dms=max_dms, max_channels=max_channels)
-
-        if not unread:
-            return "No unread messages."
-
-        lines = ["Unread messages:", ""]
-        for channel_name, messages in unread.items():
-            lines.append(f"**{channel_name}** ({len(messages)} messages)")
-            for msg in messages[:3]:
-                preview = truncate_text(msg.text, 60)
-                time_str = format_relative_time(msg.timestamp)
-                user = msg.user_name or "someone"
-                lines.append(f"  - [{user}] {time_str}: \"{preview}\"")
-            if len(messages) > 3:
-                lines.append(f"  - ... and {len(messages) - 3} more")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    elif name == "slack_channel":
-        client = get_client(workspace)
-        channel = args["channel"]
-        limit = args.get("limit", 20)
-
-        channel_id = client._resolve_channel(channel)
-        messages = client.get_messages(channel_id, limit=limit)
-
-        if not messages:
-            return f"No messages in {channel}."
-
-        lines = [f"Recent messages in {channel}:", ""]
-        for msg in messages:
-            user = msg.user_name or "Unknown"
-            time_str = format_relative_time(msg.timestamp)
-            text = msg.text.replace("\n", " ")
-            thread_info = f" (thread: {msg.reply_count} replies)" if msg.reply_count > 0 else ""
-            lines.append(f"[{time_str}] **{user}**{thread_info}: {text}")
-            lines.append(f"  _ts: {msg.ts}_")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    elif name == "slack_dm":
-        client = get_client(workspace)
-        person = args["person"]
-        limit = args.get("limit", 20)
-
-        channel_id, resolved_name = client.find_dm_by_person(person)
-        messages = client.get_messages(channel_id, limit=limit)
-
-        if not messages:
-            return f"No messages with {resolved_name}."
-
-        lines = [f"DM conversation with {resolved_name}:", ""]
-        for msg in messages:
-            # Determine if this is from the other person or me
-            if msg.user_id == client.my_user_id:
-                sender = "You"
-            else:
-                sender = resolved_name.lstrip("@")
-            time_str = format_relative_time(msg.timestamp)
-            text = msg.text.replace("\n", " ")
-            lines.append(f"[{time_str}] **{sender}**: {text}")
-            lines.append(f"  _ts: {msg.ts}_")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    elif name == "slack_thread":
-        client = get_client(workspace)
-        channel = args["channel"]
-        thread_ts = args["thread_ts"]
-
-        channel_id = client._resolve_channel(channel)
-        messages = client.get_thread(channel_id, thread_ts)
-
-        if not messages:
-            return "No messages in thread."
-
-        lines = [f"Thread in {channel}:", ""]
-        for msg in messages:
-            user = msg.user_name or "Unknown"
-            time_str = format_relative_time(msg.timestamp)
-            text = msg.text.replace("\n", " ")
-            lines.append(f"[{time_str}] **{user}**: {text}")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    elif name == "slack_search":
-        client = get_client(workspace)
-        query = args["query"]
-        count = args.get("count", 20)
-
-        messages = client.search_messages(query, count=count)
-
-        if not messages:
-            return f"No results for: {query}"
-
-        lines = [f"Search results for '{query}':", ""]
-        for msg in messages:
-            user = msg.user_name or "Unknown"
-            time_str = format_relative_time(msg.timestamp)
-            text = truncate_text(msg.text, 80)
-            lines.append(f"**{msg.channel_name}** - {user} ({time_str})")
-            lines.append(f"  {text}")
-            lines.append(f"  _ts: {msg.ts}_")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    elif name == "slack_channels":
-        client = get_client(workspace)
-        filter_type = args.get("type", "channels")
-
-        if filter_type == "all":
-            types = "public_channel,private_channel,mpim,im"
-        elif filter_type == "dms":
-            types = "im,mpim"
-        elif filter_type == "groups":
-            types = "private_channel,mpim"
-        else:  # channels
-            types = "public_channel,private_channel"
-
-        conversations = client.get_conversations(types=types)
-
-        if not conversations:
-            return "No channels found."
-
-        lines = [f"Channels ({len(conversations)}):", ""]
-
-        # Group by type
-        by_type: dict[str, list] = {}
-        for conv in conversations:
-            if conv.type not in by_type:
-                by_type[conv.type] = []
-            by_type[conv.type].append(conv)
-
-        type_labels = {
-            "channel": "Public Channels",
-            "group": "Private Channels",
-            "dm": "Direct Messages",
-            "mpim": "Group DMs",
-        }
-
-        for conv_type, convs in by_type.items():
-            label = type_labels.get(conv_type, conv_type)
-            lines.append(f"### {label} ({len(convs)})")
-            lines.append("")
-            for conv in sorted(convs, key=lambda c: c.name.lower()):
-                lines.append(f"- {conv.name} (id: `{conv.id}`)")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    elif name == "slack_send":
-        client = get_client(workspace)
-        channel = args["channel"]
-        text = args["text"]
-        reply_to_ts = args.get("reply_to_ts")
-
-        msg = client.send_message(channel, text, context_for_ts=reply_to_ts)
-        return f"Message sent to {channel} (ts: {msg.ts})"
-
-    elif name == "slack_reply":
-        client = get_client(workspace)
-        channel = args["channel"]
-        thread_ts = args["thread_ts"]
-        text = args["text"]
-        reply_to_ts = args.get("reply_to_ts")
-
-        msg = client.send_message(channel, text, thread_ts=thread_ts, context_for_ts=reply_to_ts)
-        return f"Reply sent (ts: {msg.ts})"
-
-    elif name == "slack_react":
-        client = get_client(workspace)
-        channel = args["channel"]
-        timestamp = args["timestamp"]
-        emoji = args["emoji"]
-
-        success = client.add_reaction(channel, timestamp, emoji)
-        if success:
-            return f"Added :{emoji}: reaction"
-        return f"Failed to add reaction"
+            sender = resolved_name.lstrip("@")
+        w(_DM_MESSAGE_TPL.format(
+            time=format_relative_time(msg.timestamp, now),
+            user=sender,
+            text=msg.text.translate(_FLATTEN),
+            ts=msg.ts,
+        ))
+
+    return buf.getvalue()
+
+
+async def _tool_slack_thread(args: dict[str, Any]) -> str:
+    """Read the messages in a thread."""
+    client = get_client(args.get("workspace"))
+    channel = args["channel"]
+    thread_ts = args["thread_ts"]
+
+    channel_id = client._resolve_channel(channel)
+    messages = client.get_thread(channel_id, thread_ts)
+
+    if _wants_json(args):
+        return _to_json({"channel": channel, "thread_ts": thread_ts, "messages": [asdict(m) for m in messages]})
+
+    if not messages:
+        return "No messages in thread."
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Thread in {channel}:\n\n")
+    now = datetime.now(timezone.utc)
+    for msg in messages:
+        w(_THREAD_MESSAGE_TPL.format(
+            time=format_relative_time(msg.timestamp, now),
+            user=msg.user_name or "Unknown",
+            text=msg.text.translate(_FLATTEN),
+        ))
+
+    return buf.getvalue()
+
+
+async def _tool_slack_search(args: dict[str, Any]) -> str:
+    """Search messages."""
+    client = get_client(args.get("workspace"))
+    query = args["query"]
+    count = args.get("count", 20)
+
+    messages = client.search_messages(query, count=count)
+
+    if _wants_json(args):
+        return _to_json({"query": query, "messages": [asdict(m) for m in messages]})
+
+    if not messages:
+        return f"No results for: {query}"
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Search results for '{query}':\n\n")
+    now = datetime.now(timezone.utc)
+    for msg in messages:
+        w(_SEARCH_RESULT_TPL.format(
+            channel=msg.channel_name,
+            user=msg.user_name or "Unknown",
+            time=format_relative_time(msg.timestamp, now),
+            text=truncate_text(msg.text, 80),
+            ts=msg.ts,
+        ))
+
+    return buf.getvalue()
+
+
+async def _tool_slack_channels(args: dict[str, Any]) -> str:
+    """List the channels the user is a member of."""
+    client = get_client(args.get("workspace"))
+    filter_type = args.get("type", "channels")
+
+    if filter_type == "all":
+        types = "public_channel,private_channel,mpim,im"
+    elif filter_type == "dms":
+        types = "im,mpim"
+    elif filter_type == "groups":
+        types = "private_channel,mpim"
+    else:  # channels
+        types = "public_channel,private_channel"
+
+    conversations = client.get_conversations(types=types)
+
+    if _wants_json(args):
+        return _to_json({"channels": [asdict(c) for c in conversations]})
+
+    if not conversations:
+        return "No channels found."
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Channels ({len(conversations)}):\n\n")
+
+    # Group by type
+    by_type: dict[str, list] = defaultdict(list)
+    for conv in conversations:
+        by_type[conv.type].append(conv)
+
+    type_labels = {
+        "channel": "Public Channels",
+        "group": "Private Channels",
+        "dm": "Direct Messages",
+        "mpim": "Group DMs",
+    }
+
+    for conv_type, convs in by_type.items():
+        label = type_labels.get(conv_type, conv_type)
+        w(f"### {label} ({len(convs)})\n\n")
+        for conv in sorted(convs, key=lambda c: c.name.lower()):
+            w(f"- {conv.name} (id: `{conv.id}`)\n")
+        w("\n")
+
+    return buf.getvalue()
+
+
+async def _tool_slack_send(args: dict[str, Any]) -> str:
+    """Send a message to a channel or DM."""
+    client = get_client(args.get("workspace"))
+    channel = args["channel"]
+    text = args["text"]
+    reply_to_ts = args.get("reply_to_ts")
+
+    msg = client.send_message(channel, text, context_for_ts=reply_to_ts)
+    return f"Message sent to {channel} (ts: {msg.ts})"
+
+
+async def _tool_slack_reply(args: dict[str, Any]) -> str:
+    """Reply in a thread."""
+    client = get_client(args.get("workspace"))
+    channel = args["channel"]
+    thread_ts = args["thread_ts"]
+    text = args["text"]
+    reply_to_ts = args.get("reply_to_ts")
+
+    msg = client.send_message(channel, text, thread_ts=thread_ts, context_for_ts=reply_to_ts)
+    return f"Reply sent (ts: {msg.ts})"
+
+
+async def _tool_slack_react(args: dict[str, Any]) -> str:
+    """Add an emoji reaction to a message."""
+    client = get_client(args.get("workspace"))
+    channel = args["channel"]
+    timestamp = args["timestamp"]
+    emoji = args["emoji"]
+
+    success = client.add_reaction(channel, timestamp, emoji)
+    if success:
+        return f"Added :{emoji}: reaction"
+    return f"Failed to add reaction"
+
+
+# Tool name -> handler
+_DISPATCH = {
+    "slack_workspaces": _tool_slack_workspaces,
+    "slack_summary": _tool_slack_summary,
+    "slack_unread": _tool_slack_unread,
+    "slack_channel": _tool_slack_channel,
+    "slack_dm": _tool_slack_dm,
+    "slack_thread": _tool_slack_thread,
+    "slack_search": _tool_slack_search,
+    "slack_channels": _tool_slack_channels,
+    "slack_send": _tool_slack_send,
+    "slack_reply": _tool_slack_reply,
+    "slack_react": _tool_slack_react,
+}
 
-    else:
+
+async def _handle_tool(name: str, args: dict[str, Any]) -> str:
+    """Route tool calls to handlers."""
+    handler = _DISPATCH.get(name)
+    if handler is None:
         return f"Unknown tool: {name}"
+    return await handler(args)
 
 
 async def run_server():
@@ -555,7 +675,6 @@ async def run_server():
 
 def main():
     """Entry point."""
-    import asyncio
     asyncio.run(run_server())
 
 
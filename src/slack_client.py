@@ -1,21 +1,59 @@
 """Slack API client wrapper for reading and writing messages."""
 
+import asyncio
+import hashlib
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
-from .config import WorkspaceConfig
+from .config import WorkspaceConfig, get_config
 
-# Rate limiting - Slack tier 3 allows 50+ requests per minute
-# Only add delay when paginating, not for single requests
-RATE_LIMIT_DELAY = 0.05  # seconds between paginated API calls
+# Rate limiting - calls run at full speed; on HTTP 429 the client waits for
+# the Retry-After interval Slack sends and retries, up to this many times
+RATE_LIMIT_RETRIES = 3
 
+# Max conversations fetched at once when fanning out; kept low to stay
+# within Slack's per-method rate limits
+MAX_CONCURRENT_FETCHES = 5
 
-@dataclass
+# One TLS context shared by every WebClient. slack_sdk sends requests through
+# urllib, which otherwise builds a new context (reloading the CA bundle) for
+# every request.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.set_alpn_protocols(["http/1.1"])
+
+# conversations.list type filter -> Conversation.type
+CONVERSATION_TYPES = {"public_channel": "channel", "private_channel": "group", "mpim": "mpim", "im": "dm"}
+ALL_CONVERSATION_TYPES = ",".join(CONVERSATION_TYPES)
+
+# How long the conversation list is reused before listing again
+CONVERSATIONS_CACHE_TTL = 300  # seconds
+
+# How long resolved user names are trusted before looking them up again
+USER_CACHE_TTL = 3600  # seconds
+USER_CACHE_MAXSIZE = 2000  # users kept per workspace (raised to fit a full member list)
+
+# The latest raw conversations.history page per channel is reused briefly:
+# a later request whose window it covers (a smaller limit, a later oldest)
+# is answered from it instead of calling the API again
+MESSAGES_CACHE_TTL = 60  # seconds
+MESSAGES_CACHE_MAXSIZE = 500  # channels kept per client
+
+
+@dataclass(slots=True)
 class User:
     """Slack user info."""
     id: str
@@ -25,6 +63,93 @@ class User:
 
 
 @dataclass
+class UserCache:
+    """Resolved users for one workspace, with expiry and LRU eviction.
+
+    Safe to share between threads.
+    """
+    ttl: float = USER_CACHE_TTL
+    maxsize: int = USER_CACHE_MAXSIZE
+    users: OrderedDict[str, tuple[User, float]] = field(default_factory=OrderedDict)
+    primed_at: float = 0
+    prime_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def get(self, user_id: str) -> Optional[User]:
+        """Return a cached user, or None if missing or expired."""
+        with self._lock:
+            entry = self.users.get(user_id)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at < time.time():
+                del self.users[user_id]
+                return None
+            self.users.move_to_end(user_id)
+            return user
+
+    def put(self, user: User) -> None:
+        """Cache a user until the TTL runs out, evicting the least recently used."""
+        with self._lock:
+            self.users[user.id] = (user, time.time() + self.ttl)
+            self.users.move_to_end(user.id)
+            while len(self.users) > self.maxsize:
+                self.users.popitem(last=False)
+
+    def load(self, users: list[User], primed_at: float) -> None:
+        """Cache a full member list, raising the size limit so none of it is evicted."""
+        expires_at = primed_at + self.ttl
+        with self._lock:
+            self.maxsize = max(self.maxsize, len(users))
+            for user in users:
+                self.users[user.id] = (user, expires_at)
+                self.users.move_to_end(user.id)
+            self.primed_at = primed_at
+
+    def find_by_real_name(self, real_name: str) -> Optional[User]:
+        """Return a cached user whose real name matches (case insensitive), if any."""
+        real_name = real_name.lower()
+        now = time.time()
+        with self._lock:
+            for user, expires_at in self.users.values():
+                if expires_at >= now and user.real_name.lower() == real_name:
+                    return user
+        return None
+
+    @property
+    def is_primed(self) -> bool:
+        """Whether loading the full member list was attempted within the TTL."""
+        return (time.time() - self.primed_at) < self.ttl
+
+
+# User caches shared by every client of the same workspace (keyed by workspace key)
+_user_caches: dict[str, UserCache] = {}
+
+# On-disk copies of the user and conversation caches, so a new process (a CLI
+# run, an MCP server restart) starts warm instead of re-paging the API
+CACHE_DIR = Path.home() / ".cache" / "slack-mcp"
+
+
+def _read_cache_file(name: str) -> Optional[dict]:
+    """Read a JSON cache file, or None if it is missing or unreadable."""
+    try:
+        return json.loads((CACHE_DIR / name).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_file(name: str, data: dict) -> None:
+    """Atomically replace a JSON cache file (best effort)."""
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            json.dump(data, f)
+        os.replace(f.name, CACHE_DIR / name)
+    except OSError:
+        pass
+
+
+@dataclass(slots=True)
 class Message:
     """A Slack message."""
     ts: str
@@ -44,7 +169,7 @@ class Message:
         return f"slack://channel?id={self.channel_id}&message={self.ts}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """A Slack conversation (channel, DM, or group DM)."""
     id: str
@@ -57,18 +182,29 @@ class Conversation:
     latest_message: Optional[Message] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackClient:
     """Client for interacting with a single Slack workspace."""
     workspace: WorkspaceConfig
     client: WebClient = field(init=False)
-    _user_cache: dict[str, User] = field(default_factory=dict)
+    _user_cache: UserCache = field(init=False)
     _my_user_id: Optional[str] = None
     _conversations_cache: Optional[list[Conversation]] = None
     _conversations_cache_time: float = 0
+    # Lowercased conversation name (without #/@) -> ID, rebuilt with _conversations_cache
+    _name_to_id: dict[str, str] = field(default_factory=dict)
+    # channel -> (fetched_at, limit, oldest, raw messages), least recently used first
+    _messages_cache: OrderedDict[str, tuple[float, int, float, list[dict]]] = field(default_factory=OrderedDict, repr=False)
+    _messages_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def __post_init__(self):
-        self.client = WebClient(token=self.workspace.token)
+        self.client = WebClient(token=self.workspace.token, ssl=_SSL_CONTEXT)
+        self.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=RATE_LIMIT_RETRIES))
+        if self.workspace.key not in _user_caches:
+            _user_caches[self.workspace.key] = UserCache()
+            self._load_user_cache()
+        self._user_cache = _user_caches[self.workspace.key]
+        self._load_conversations_cache()
 
     @property
     def my_user_id(self) -> str:
@@ -80,52 +216,130 @@ class SlackClient:
 
     def get_user(self, user_id: str) -> User:
         """Get user info, with caching."""
-        if user_id not in self._user_cache:
+        user = self._user_cache.get(user_id)
+        if user is None and not self._user_cache.is_primed:
+            # First miss: load everyone in a few users.list pages rather
+            # than one users.info call per unseen user
+            self.prime_user_cache()
+            user = self._user_cache.get(user_id)
+        if user is None:
             try:
                 response = self.client.users_info(user=user_id)
-                user_data = response["user"]
-                self._user_cache[user_id] = User(
-                    id=user_id,
-                    name=user_data.get("name", "unknown"),
-                    real_name=user_data.get("real_name", user_data.get("name", "Unknown")),
-                    is_bot=user_data.get("is_bot", False),
-                )
+                user = self._make_user(user_id, response["user"])
             except SlackApiError:
-                self._user_cache[user_id] = User(
+                user = User(
                     id=user_id,
                     name="unknown",
                     real_name="Unknown User",
                 )
-        return self._user_cache[user_id]
+            self._user_cache.put(user)
+        return user
+
+    def _make_user(self, user_id: str, user_data: dict) -> User:
+        """Build a User from a Slack user object."""
+        return User(
+            id=user_id,
+            name=user_data.get("name", "unknown"),
+            real_name=user_data.get("real_name", user_data.get("name", "Unknown")),
+            is_bot=user_data.get("is_bot", False),
+        )
+
+    def prime_user_cache(self) -> None:
+        """Load all workspace members with users.list so names resolve without users.info calls."""
+        # Only one thread lists members; the others wait and reuse the result
+        with self._user_cache.prime_lock:
+            if self._user_cache.is_primed:
+                return
+
+            users = []
+            complete = True
+            cursor = None
+            try:
+                while True:
+                    response = self.client.users_list(limit=1000, cursor=cursor)
 
-    def get_conversations(self, types: str = "public_channel,private_channel,mpim,im", use_cache: bool = True) -> list[Conversation]:
-        """Get all conversations the user is a member of."""
+                    for member in response["members"]:
+                        users.append(self._make_user(member["id"], member))
+
+                    cursor = response.get("response_metadata", {}).get("next_cursor")
+                    if not cursor:
+                        break
+            except SlackApiError:
+                # Fall back to per-user lookups (not retried until the TTL passes)
+                complete = False
+
+            self._user_cache.load(users, time.time())
+            if complete:
+                _write_cache_file(self._cache_file_name("users"), {
+                    "primed_at": self._user_cache.primed_at,
+                    "users": [asdict(u) for u in users],
+                })
+
+    def _load_user_cache(self) -> None:
+        """Restore a full member list saved by an earlier process, if still fresh."""
+        cache = _user_caches[self.workspace.key]
+        data = _read_cache_file(self._cache_file_name("users"))
+        try:
+            if not data or time.time() - data["primed_at"] >= cache.ttl:
+                return
+            users = [User(**user_data) for user_data in data["users"]]
+        except (KeyError, TypeError):
+            return  # Written by an incompatible version; ignore it
+        cache.load(users, data["primed_at"])
+
+    def _cache_file_name(self, kind: str) -> str:
+        """Name of this workspace's on-disk cache file of the given kind."""
+        # Include a token digest: the same config key (e.g. "default") can
+        # point at a different workspace after the token changes
+        digest = hashlib.sha256(self.workspace.token.encode()).hexdigest()[:16]
+        return f"{self.workspace.key}-{digest}-{kind}.json"
+
+    def get_conversations(self, types: str = ALL_CONVERSATION_TYPES, use_cache: bool = True) -> list[Conversation]:
+        """Get all conversations the user is a member of.
+
+        Only the requested types are fetched from Slack; the full list is
+        cached and also serves narrower requests while fresh.
+        """
+        type_set = set(types.split(","))
         # Return cached result if fresh (5 min cache)
-        cache_ttl = 300
-        if use_cache and self._conversations_cache and (time.time() - self._conversations_cache_time) < cache_ttl:
+        if use_cache and self._conversations_cache and (time.time() - self._conversations_cache_time) < CONVERSATIONS_CACHE_TTL:
             # Filter cached results by type
-            type_set = set(types.split(","))
-            type_map = {"public_channel": "channel", "private_channel": "group", "mpim": "mpim", "im": "dm"}
-            allowed = {type_map.get(t, t) for t in type_set}
+            allowed = {CONVERSATION_TYPES.get(t, t) for t in type_set}
             return [c for c in self._conversations_cache if c.type in allowed]
 
-        conversations = []
-        cursor = None
+        conversations = list(self._iter_conversations(types))
+
+        # Cache all conversations (we fetched all types, in whatever order)
+        if type_set >= CONVERSATION_TYPES.keys():
+            self._set_conversations_cache(conversations, time.time())
+            _write_cache_file(self._cache_file_name("conversations"), {
+                "fetched_at": self._conversations_cache_time,
+                "conversations": [asdict(c) for c in conversations],
+            })
+
+        return conversations
+
+    def _iter_conversations(self, types: str) -> Iterator[Conversation]:
+        """Yield conversations from the API page by page (uncached).
 
+        Stopping early skips the remaining pages.
+        """
+        cursor = None
         while True:
-            time.sleep(RATE_LIMIT_DELAY)
             response = self.client.conversations_list(
                 types=types,
                 exclude_archived=True,
-                limit=200,
+                limit=1000,
                 cursor=cursor,
             )
 
             for conv in response["channels"]:
+                # conv_type is always one of a few string literals (already
+                # interned); intern the name since messages share it
                 conv_type = self._get_conversation_type(conv)
-                name = self._get_conversation_name(conv, conv_type)
+                name = sys.intern(self._get_conversation_name(conv, conv_type))
 
-                conversations.append(Conversation(
+                yield Conversation(
                     id=conv["id"],
                     name=name,
                     type=conv_type,
@@ -133,18 +347,37 @@ class SlackClient:
                     is_archived=conv.get("is_archived", False),
                     unread_count=conv.get("unread_count", 0),
                     last_read=conv.get("last_read"),
-                ))
+                )
 
             cursor = response.get("response_metadata", {}).get("next_cursor")
             if not cursor:
                 break
 
-        # Cache all conversations (we fetched all types)
-        if types == "public_channel,private_channel,mpim,im":
-            self._conversations_cache = conversations
-            self._conversations_cache_time = time.time()
-
-        return conversations
+    def _load_conversations_cache(self) -> None:
+        """Restore a conversation list saved by an earlier process, if still fresh."""
+        data = _read_cache_file(self._cache_file_name("conversations"))
+        try:
+            if not data or time.time() - data["fetched_at"] >= CONVERSATIONS_CACHE_TTL:
+                return
+            conversations = [
+                Conversation(**{**conv_data, "name": sys.intern(conv_data["name"]), "latest_message": None})
+                for conv_data in data["conversations"]
+            ]
+        except (KeyError, TypeError):
+            return  # Written by an incompatible version; ignore it
+        self._set_conversations_cache(conversations, data["fetched_at"])
+
+    def _set_conversations_cache(self, conversations: list[Conversation], fetched_at: float) -> None:
+        """Store the full conversation list and index it by name."""
+        self._conversations_cache = conversations
+        self._conversations_cache_time = fetched_at
+        self._name_to_id = {c.name.lower().lstrip("#@"): c.id for c in conversations}
+
+    def _lookup_conversation_id(self, name: str) -> Optional[str]:
+        """Look up a conversation ID by name in the cached index, if it is fresh."""
+        if time.time() - self._conversations_cache_time >= CONVERSATIONS_CACHE_TTL:
+            return None
+        return self._name_to_id.get(name.lower().lstrip("#@"))
 
     def _get_conversation_type(self, conv: dict) -> str:
         """Determine conversation type."""
@@ -186,23 +419,17 @@ class SlackClient:
         limit: int = 100,
         oldest: Optional[float] = None,
         latest: Optional[float] = None,
+        use_cache: bool = True,
     ) -> list[Message]:
         """Get messages from a channel."""
-        kwargs = {"channel": channel_id, "limit": limit}
-        if oldest:
-            kwargs["oldest"] = str(oldest)
-        if latest:
-            kwargs["latest"] = str(latest)
-
-        try:
-            response = self.client.conversations_history(**kwargs)
-        except SlackApiError as e:
-            if e.response["error"] == "channel_not_found":
-                return []
-            raise
+        raw_messages = self._fetch_history(channel_id, limit, oldest, latest, use_cache)
+        if raw_messages is None:
+            return []
 
+        from_ts, utc = datetime.fromtimestamp, timezone.utc  # Locals for the per-message loop
+        mention_tag = f"<@{self.my_user_id}>"
         messages = []
-        for msg in response.get("messages", []):
+        for msg in raw_messages:
             if msg.get("subtype") in ("channel_join", "channel_leave", "bot_message"):
                 continue
 
@@ -213,7 +440,7 @@ class SlackClient:
                 user_name = user.real_name
 
             # Check if this message mentions the current user
-            is_mention = f"<@{self.my_user_id}>" in msg.get("text", "")
+            is_mention = mention_tag in msg.get("text", "")
 
             ts = msg.get("ts", "")
             messages.append(Message(
@@ -225,11 +452,75 @@ class SlackClient:
                 thread_ts=msg.get("thread_ts"),
                 reply_count=msg.get("reply_count", 0),
                 is_mention=is_mention,
-                timestamp=datetime.fromtimestamp(float(ts), tz=timezone.utc) if ts else None,
+                timestamp=from_ts(float(ts), tz=utc) if ts else None,
             ))
 
         return messages
 
+    def _fetch_history(
+        self,
+        channel_id: str,
+        limit: int,
+        oldest: Optional[float],
+        latest: Optional[float],
+        use_cache: bool,
+    ) -> Optional[list[dict]]:
+        """Fetch raw messages with conversations.history, or None if the channel is gone."""
+        now = time.time()
+        oldest = oldest or 0
+        if use_cache and not latest:
+            cached = self._cached_history(channel_id, limit, oldest, now)
+            if cached is not None:
+                return cached
+
+        kwargs = {"channel": channel_id, "limit": limit}
+        if oldest:
+            kwargs["oldest"] = str(oldest)
+        if latest:
+            kwargs["latest"] = str(latest)
+
+        try:
+            response = self.client.conversations_history(**kwargs)
+        except SlackApiError as e:
+            if e.response["error"] == "channel_not_found":
+                return None
+            raise
+
+        raw_messages = response.get("messages", [])
+        if not latest:
+            with self._messages_lock:
+                self._messages_cache[channel_id] = (now, limit, oldest, raw_messages)
+                self._messages_cache.move_to_end(channel_id)
+                while len(self._messages_cache) > MESSAGES_CACHE_MAXSIZE:
+                    self._messages_cache.popitem(last=False)
+        return raw_messages
+
+    def _cached_history(self, channel_id: str, limit: int, oldest: float, now: float) -> Optional[list[dict]]:
+        """Answer a history request from the cached page for the channel, if it covers it."""
+        with self._messages_lock:
+            entry = self._messages_cache.get(channel_id)
+            if entry is None:
+                return None
+            fetched_at, page_limit, page_oldest, page = entry
+            if now - fetched_at >= MESSAGES_CACHE_TTL or oldest < page_oldest:
+                return None
+            self._messages_cache.move_to_end(channel_id)
+
+        # Pages are newest first; oldest is exclusive, as in the API
+        messages = [m for m in page if float(m.get("ts", 0)) > oldest]
+        if len(messages) >= limit:
+            return messages[:limit]
+        # Fewer than asked for: fine if the page held the whole window, or if
+        # it already reaches back past the requested oldest
+        if len(page) < page_limit or (page and float(page[-1].get("ts", 0)) <= oldest):
+            return messages
+        return None
+
+    def _forget_messages(self, channel_id: str) -> None:
+        """Drop cached history for a channel (after posting to it)."""
+        with self._messages_lock:
+            self._messages_cache.pop(channel_id, None)
+
     def get_thread(self, channel_id: str, thread_ts: str, limit: int = 100) -> list[Message]:
         """Get messages in a thread."""
         try:
@@ -241,6 +532,7 @@ class SlackClient:
         except SlackApiError:
             return []
 
+        from_ts, utc = datetime.fromtimestamp, timezone.utc  # Locals for the per-message loop
         messages = []
         for msg in response.get("messages", []):
             user_id = msg.get("user")
@@ -257,7 +549,7 @@ class SlackClient:
                 user_name=user_name,
                 channel_id=channel_id,
                 thread_ts=thread_ts,
-                timestamp=datetime.fromtimestamp(float(ts), tz=timezone.utc) if ts else None,
+                timestamp=from_ts(float(ts), tz=utc) if ts else None,
             ))
 
         return messages
@@ -269,24 +561,61 @@ class SlackClient:
         check messages since last_read for recently active conversations.
         """
         cutoff = time.time() - (hours * 3600)
-        conversations = self.get_conversations()
+        dm_convos, channel_convos = self._unread_candidates(max_dms, max_channels)
         unread: dict[str, list[Message]] = {}
 
-        # Check DMs first (most important) - sorted by last_read (most recent first)
-        dm_convos = [c for c in conversations if c.type == "dm" and not c.is_archived]
-        dm_convos.sort(key=lambda c: float(c.last_read) if c.last_read else 0, reverse=True)
-        for conv in dm_convos[:max_dms]:
-            oldest = float(conv.last_read) if conv.last_read else cutoff
-            messages = self.get_messages(conv.id, limit=10, oldest=oldest)
+        for conv in dm_convos:
+            name, messages = self._unread_in_dm(conv, cutoff)
+            if messages:
+                unread[name] = messages
+
+        for conv in channel_convos:
+            messages = self._unread_in_channel(conv, cutoff, check_threads)
+            if messages:
+                unread[conv.name] = messages
+
+        return unread
 
-            # Filter to only messages from others (not my own)
-            messages = [m for m in messages if m.user_id != self.my_user_id]
+    async def get_unread_messages_async(self, hours: int = 24, max_dms: int = 15, max_channels: int = 15, check_threads: bool = True) -> dict[str, list[Message]]:
+        """Like get_unread_messages, but checks conversations concurrently.
 
+        Up to MAX_CONCURRENT_FETCHES conversations are checked at once, each
+        in a worker thread. Results keep the same order as the sync version.
+        """
+        cutoff = time.time() - (hours * 3600)
+
+        # Look up our own user ID once, before the concurrent checks need it
+        await asyncio.to_thread(lambda: self.my_user_id)
+        dm_convos, channel_convos = await asyncio.to_thread(self._unread_candidates, max_dms, max_channels)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def bounded(func, *args):
+            async with semaphore:
+                return await asyncio.to_thread(func, *args)
+
+        dm_results, channel_results = await asyncio.gather(
+            asyncio.gather(*(bounded(self._unread_in_dm, conv, cutoff) for conv in dm_convos)),
+            asyncio.gather(*(bounded(self._unread_in_channel, conv, cutoff, check_threads) for conv in channel_convos)),
+        )
+
+        unread: dict[str, list[Message]] = {}
+        for name, messages in dm_results:
             if messages:
-                name = self.resolve_dm_name(conv)
-                for msg in messages:
-                    msg.channel_name = name
                 unread[name] = messages
+        for conv, messages in zip(channel_convos, channel_results):
+            if messages:
+                unread[conv.name] = messages
+
+        return unread
+
+    def _unread_candidates(self, max_dms: int, max_channels: int) -> tuple[list[Conversation], list[Conversation]]:
+        """Pick the DMs and channels to check for unread messages."""
+        conversations = self.get_conversations()
+
+        # Check DMs first (most important) - sorted by last_read (most recent first)
+        dm_convos = [c for c in conversations if c.type == "dm" and not c.is_archived]
+        dm_convos.sort(key=lambda c: float(c.last_read) if c.last_read else 0, reverse=True)
 
         # Check key channels for messages AND thread replies
         key_channels = ["general", "random", "group-meeting"]
@@ -295,36 +624,54 @@ class SlackClient:
         # Prioritize key channels, then others
         sorted_channels = sorted(channel_convos, key=lambda c: (c.name.lstrip("#") not in key_channels, c.name))
 
-        for conv in sorted_channels[:max_channels]:
-            channel_messages = []
-
-            # Get recent messages
-            messages = self.get_messages(conv.id, limit=30, oldest=cutoff)
-
-            for msg in messages:
-                msg.channel_name = conv.name
-
-                # Check if this message has thread replies we haven't seen
-                if check_threads and msg.reply_count and msg.reply_count > 0:
-                    thread_msgs = self.get_thread(conv.id, msg.ts, limit=10)
-                    for tmsg in thread_msgs:
-                        # Skip the parent message (already have it)
-                        if tmsg.ts == msg.ts:
-                            continue
-                        # Only include recent replies from others
-                        if tmsg.user_id != self.my_user_id and tmsg.timestamp and tmsg.timestamp.timestamp() > cutoff:
-                            tmsg.channel_name = f"{conv.name} (thread)"
-                            channel_messages.append(tmsg)
-
-                # Include channel message if from others and mentions me or is recent
-                if msg.user_id != self.my_user_id:
-                    if msg.is_mention:
-                        channel_messages.append(msg)
-
-            if channel_messages:
-                unread[conv.name] = channel_messages
+        return dm_convos[:max_dms], sorted_channels[:max_channels]
+
+    def _unread_in_dm(self, conv: Conversation, cutoff: float) -> tuple[str, list[Message]]:
+        """Get unread messages from others in a DM, with the DM's display name."""
+        oldest = float(conv.last_read) if conv.last_read else cutoff
+        messages = self.get_messages(conv.id, limit=10, oldest=oldest)
+
+        # Filter to only messages from others (not my own)
+        my_user_id = self.my_user_id
+        messages = [m for m in messages if m.user_id != my_user_id]
+
+        if not messages:
+            return conv.name, []
+
+        name = self.resolve_dm_name(conv)
+        for msg in messages:
+            msg.channel_name = name
+        return name, messages
+
+    def _unread_in_channel(self, conv: Conversation, cutoff: float, check_threads: bool) -> list[Message]:
+        """Get recent mentions and thread replies from others in a channel."""
+        channel_messages = []
+        my_user_id = self.my_user_id
+
+        # Get recent messages
+        messages = self.get_messages(conv.id, limit=30, oldest=cutoff)
+
+        for msg in messages:
+            msg.channel_name = conv.name
+
+            # Check if this message has thread replies we haven't seen
+            if check_threads and msg.reply_count and msg.reply_count > 0:
+                thread_msgs = self.get_thread(conv.id, msg.ts, limit=10)
+                for tmsg in thread_msgs:
+                    # Skip the parent message (already have it)
+                    if tmsg.ts == msg.ts:
+                        continue
+                    # Only include recent replies from others
+                    if tmsg.user_id != my_user_id and tmsg.timestamp and tmsg.timestamp.timestamp() > cutoff:
+                        tmsg.channel_name = f"{conv.name} (thread)"
+                        channel_messages.append(tmsg)
+
+            # Include channel message if from others and mentions me or is recent
+            if msg.user_id != my_user_id:
+                if msg.is_mention:
+                    channel_messages.append(msg)
 
-        return unread
+        return channel_messages
 
     def get_mentions(self, hours: int = 24) -> list[Message]:
         """Get messages where the user was mentioned."""
@@ -362,10 +709,14 @@ class SlackClient:
         except SlackApiError:
             return []
 
+        from_ts, utc = datetime.fromtimestamp, timezone.utc  # Locals for the per-message loop
         messages = []
         for match in response.get("messages", {}).get("matches", []):
             user_id = match.get("user")
+            # The same users and channels recur across matches
             user_name = match.get("username")
+            if user_name:
+                user_name = sys.intern(user_name)
 
             channel = match.get("channel", {})
             channel_id = channel.get("id", "")
@@ -378,8 +729,8 @@ class SlackClient:
                 user_id=user_id,
                 user_name=user_name,
                 channel_id=channel_id,
-                channel_name=f"#{channel_name}",
-                timestamp=datetime.fromtimestamp(float(ts), tz=timezone.utc) if ts else None,
+                channel_name=sys.intern(f"#{channel_name}"),
+                timestamp=from_ts(float(ts), tz=utc) if ts else None,
             ))
 
         return messages
@@ -414,6 +765,7 @@ class SlackClient:
             kwargs["thread_ts"] = thread_ts
 
         response = self.client.chat_postMessage(**kwargs)
+        self._forget_messages(channel_id)
 
         return Message(
             ts=response["ts"],
@@ -426,7 +778,7 @@ class SlackClient:
     def _maybe_add_reply_context(self, channel_id: str, reply_to_ts: str, text: str) -> str:
         """Add context prefix if replying to a non-recent message."""
         # Get recent messages to check if this is the most recent
-        recent = self.get_messages(channel_id, limit=3)
+        recent = self.get_messages(channel_id, limit=3, use_cache=False)
 
         if not recent:
             return text
@@ -511,6 +863,10 @@ class SlackClient:
         # Handle @user for DMs
         if channel.startswith("@"):
             username = channel[1:]
+            # DMs are indexed as "user:<id>", so @<user id> resolves directly
+            conv_id = self._lookup_conversation_id(f"user:{username}")
+            if conv_id:
+                return conv_id
             # Find user by name
             for conv in self.get_conversations(types="im"):
                 if username.lower() in conv.name.lower():
@@ -518,9 +874,16 @@ class SlackClient:
             raise ValueError(f"Could not find DM with user: {username}")
 
         # Find channel by name
-        for conv in self.get_conversations(types="public_channel,private_channel"):
-            if conv.name.lstrip("#") == channel:
-                return conv.id
+        conv_id = self._lookup_conversation_id(channel)
+        if conv_id:
+            return conv_id
+        # Not cached: page through the API, stopping at the first match
+        conv = next(
+            (c for c in self._iter_conversations("public_channel,private_channel") if c.name.lstrip("#") == channel),
+            None,
+        )
+        if conv:
+            return conv.id
 
         raise ValueError(f"Could not find channel: {channel}")
 
@@ -534,8 +897,26 @@ class SlackClient:
             Tuple of (channel_id, resolved_name)
         """
         person_lower = person.lower().strip().lstrip("@")
+
+        # A user ID needs no name resolution at all
+        conv_id = self._lookup_conversation_id(f"user:{person_lower}")
+        if conv_id:
+            return conv_id, f"@{self.get_user(person.strip().lstrip('@').upper()).real_name}"
+
         dm_convs = self.get_conversations(types="im")
 
+        # Match the name against known users first, so no DM needs resolving
+        if not self._user_cache.is_primed:
+            self.prime_user_cache()
+        user = self._user_cache.find_by_real_name(person_lower)
+        if user:
+            dm_name = f"@user:{user.id}"
+            conv_id = self._lookup_conversation_id(dm_name)
+            if conv_id is None:
+                conv_id = next((c.id for c in dm_convs if c.name == dm_name), None)
+            if conv_id:
+                return conv_id, f"@{user.real_name}"
+
         # Try exact match first, then partial
         for conv in dm_convs:
             # Resolve the name for matching
@@ -554,3 +935,33 @@ class SlackClient:
                 return conv.id, resolved
 
         raise ValueError(f"Could not find DM with: {person}")
+
+
+# Clients shared per workspace for the life of the process (keyed by workspace key)
+_clients: dict[str, SlackClient] = {}
+
+
+def get_client(workspace: Optional[str] = None) -> SlackClient:
+    """Get or create the shared Slack client for a workspace."""
+    # Fast path: a single dict lookup once the client exists
+    key = workspace or get_config().default_workspace
+    client = _clients.get(key) if key else None
+
+    if client is None:
+        ws = get_config().get_workspace(workspace)
+        client = _clients.get(ws.key)
+        if client is None:
+            client = _clients[ws.key] = SlackClient(workspace=ws)
+
+    return client
+
+
+def get_all_clients() -> list[SlackClient]:
+    """Get shared clients for all configured workspaces."""
+    config = get_config()
+    clients = []
+    for ws in config.list_workspaces():
+        if ws.key not in _clients:
+            _clients[ws.key] = SlackClient(workspace=ws)
+        clients.append(_clients[ws.key])
+    return clients
@@ -1,14 +1,47 @@
 """Message summarization and categorization."""
 
+import asyncio
+import heapq
+import io
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
-
-from .slack_client import Message, SlackClient
-
-
-@dataclass
+from typing import Optional, TextIO
+
+from .slack_client import MAX_CONCURRENT_FETCHES, Conversation, Message, SlackClient
+
+# Question/request patterns for action items, fused into one alternation so
+# each message is scanned once
+_ACTION_ITEM_RE = re.compile("|".join(f"(?:{p})" for p in (
+    r"\?$",  # Ends with question mark
+    r"^(can|could|would|will|do|does|did|is|are|have|has|should)\s",
+    r"(please|pls)\s",
+    r"(need|needs)\s+(you|your)",
+    r"(review|check|look at|take a look)",
+    r"(thoughts|opinion|input|feedback)\?",
+    r"when (can|will|could)",
+    r"eta\??",
+)))
+
+# Slack markup stripped by truncate_text, in one alternation so each message
+# is scanned once: user mention, channel mention (1), labeled link (2, 3),
+# bare link (4)
+_FMT_RE = re.compile(r"<@\w+>|<#\w+\|([^>]+)>|<([^|>]+)\|([^>]+)>|<([^>]+)>")
+
+
+def _replace_markup(match: re.Match) -> str:
+    """Plain-text replacement for one piece of Slack markup."""
+    group = match.lastindex
+    if group is None:
+        return "@user"
+    if group == 1:
+        return f"#{match[1]}"
+    return match[group]  # Link label (3) or bare URL (4)
+
+
+@dataclass(slots=True)
 class ChannelSummary:
     """Summary of activity in a channel."""
     name: str
@@ -20,7 +53,7 @@ class ChannelSummary:
     top_messages: list[Message] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceSummary:
     """Summary of a single workspace."""
     name: str
@@ -35,49 +68,40 @@ class WorkspaceSummary:
 
 def is_action_item(message: Message, my_user_id: str) -> bool:
     """Detect if a message is an action item (question or request)."""
-    text = message.text.lower()
-
     # Check if it's directed at the user
     if f"<@{my_user_id}>" not in message.text:
         return False
 
     # Question patterns
-    question_patterns = [
-        r"\?$",  # Ends with question mark
-        r"^(can|could|would|will|do|does|did|is|are|have|has|should)\s",
-        r"(please|pls)\s",
-        r"(need|needs)\s+(you|your)",
-        r"(review|check|look at|take a look)",
-        r"(thoughts|opinion|input|feedback)\?",
-        r"when (can|will|could)",
-        r"eta\??",
-    ]
-
-    for pattern in question_patterns:
-        if re.search(pattern, text):
-            return True
-
-    return False
-
-
-def format_relative_time(dt: Optional[datetime]) -> str:
-    """Format a datetime as relative time."""
+    return _ACTION_ITEM_RE.search(message.text.lower()) is not None
+
+
+# Seconds per unit, for format_relative_time
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+
+
+def format_relative_time(dt: Optional[datetime], now: Optional[datetime] = None) -> str:
+    """Format a datetime as relative time.
+
+    Pass ``now`` when formatting many timestamps to avoid re-reading the clock.
+    """
     if not dt:
         return "unknown"
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     diff = now - dt
 
     seconds = diff.total_seconds()
-    if seconds < 60:
+    if seconds < _MINUTE:
         return "just now"
-    if seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes}m ago"
-    if seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours}h ago"
-    days = int(seconds / 86400)
+    if seconds < _HOUR:
+        return f"{int(seconds // _MINUTE)}m ago"
+    if seconds < _DAY:
+        return f"{int(seconds // _HOUR)}h ago"
+    days = int(seconds // _DAY)
     if days == 1:
         return "yesterday"
     if days < 7:
@@ -87,13 +111,8 @@ def format_relative_time(dt: Optional[datetime]) -> str:
 
 def truncate_text(text: str, max_len: int = 100) -> str:
     """Truncate text with ellipsis."""
-    # Remove user mentions formatting
-    text = re.sub(r"<@\w+>", "@user", text)
-    # Remove channel mentions formatting
-    text = re.sub(r"<#\w+\|([^>]+)>", r"#\1", text)
-    # Remove link formatting
-    text = re.sub(r"<([^|>]+)\|([^>]+)>", r"\2", text)
-    text = re.sub(r"<([^>]+)>", r"\1", text)
+    # Remove mention and link formatting
+    text = _FMT_RE.sub(_replace_markup, text)
     # Collapse whitespace
     text = " ".join(text.split())
 
@@ -104,62 +123,70 @@ def truncate_text(text: str, max_len: int = 100) -> str:
 
 def quick_summary(client: SlackClient, hours: int = 24) -> str:
     """Fast summary - just scans recent DMs and a few key channels."""
-    import time
     cutoff = time.time() - (hours * 3600)
-    lines = [f"# Quick Summary - {client.workspace.name}", ""]
+    now = datetime.now(timezone.utc)
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Quick Summary - {client.workspace.name}\n\n")
+
+    # Resolve all user names up front instead of one users.info call each
+    client.prime_user_cache()
 
     # Get conversations (this is cached-ish, fast)
     conversations = client.get_conversations()
     dm_convs = [c for c in conversations if c.type == "dm"]
     channel_convs = [c for c in conversations if c.type in ("channel", "group")]
 
-    # Just check 5 most recent DMs
+    # Just check 5 most recent DMs and 5 most active channels, fetched concurrently
+    recent_dms = dm_convs[:5]
+    active_channels = channel_convs[:5]
+    client.my_user_id  # Look up once before the concurrent fetches need it
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        dm_futures = [executor.submit(client.get_messages, conv.id, limit=3, oldest=cutoff) for conv in recent_dms]
+        channel_futures = [executor.submit(client.get_messages, conv.id, limit=20, oldest=cutoff) for conv in active_channels]
+
     dm_messages = []
-    for conv in dm_convs[:5]:
-        messages = client.get_messages(conv.id, limit=3, oldest=cutoff)
+    for conv, future in zip(recent_dms, dm_futures):
+        messages = future.result()
         # Resolve the DM name only for convs we're showing
         resolved_name = client.resolve_dm_name(conv)
         for msg in messages:
             msg.channel_name = resolved_name
             dm_messages.append(msg)
 
-    dm_messages.sort(key=lambda m: m.ts, reverse=True)
+    dm_messages = heapq.nlargest(10, dm_messages, key=lambda m: m.ts)
 
     if dm_messages:
-        lines.append("## Recent DMs")
-        lines.append("")
-        for msg in dm_messages[:10]:
-            time_str = format_relative_time(msg.timestamp)
+        w("## Recent DMs\n\n")
+        for msg in dm_messages:
+            time_str = format_relative_time(msg.timestamp, now)
             text = truncate_text(msg.text, 60)
-            lines.append(f"- **{msg.channel_name}** ({time_str}): \"{text}\"")
-        lines.append("")
+            w(f"- **{msg.channel_name}** ({time_str}): \"{text}\"\n")
+        w("\n")
 
-    # Check 5 most active channels for mentions
+    # Check the channels for mentions
     mentions = []
-    for conv in channel_convs[:5]:
-        messages = client.get_messages(conv.id, limit=20, oldest=cutoff)
+    for conv, future in zip(active_channels, channel_futures):
+        messages = future.result()
         for msg in messages:
             if msg.is_mention:
                 msg.channel_name = conv.name
                 mentions.append(msg)
 
     if mentions:
-        lines.append("## Mentions")
-        lines.append("")
+        w("## Mentions\n\n")
         for msg in mentions[:10]:
             from_name = msg.user_name or "Someone"
-            time_str = format_relative_time(msg.timestamp)
+            time_str = format_relative_time(msg.timestamp, now)
             text = truncate_text(msg.text, 60)
-            lines.append(f"- **{msg.channel_name}** - {from_name} ({time_str}): \"{text}\"")
-        lines.append("")
+            w(f"- **{msg.channel_name}** - {from_name} ({time_str}): \"{text}\"\n")
+        w("\n")
 
     # Quick channel activity counts
-    lines.append("## Channel Activity (top 10)")
-    lines.append("")
-    lines.append(f"You're in {len(channel_convs)} channels, {len(dm_convs)} DMs")
-    lines.append("")
+    w("## Channel Activity (top 10)\n\n")
+    w(f"You're in {len(channel_convs)} channels, {len(dm_convs)} DMs\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def summarize_workspace(client: SlackClient, hours: int = 24, max_channels: int = 10) -> WorkspaceSummary:
@@ -170,45 +197,98 @@ def summarize_workspace(client: SlackClient, hours: int = 24, max_channels: int
         hours: Hours to look back
         max_channels: Max channels to scan (to avoid rate limits)
     """
-    import time
     cutoff = time.time() - (hours * 3600)
 
-    summary = WorkspaceSummary(name=client.workspace.name)
+    # Resolve all user names up front instead of one users.info call each
+    client.prime_user_cache()
+
+    dm_convs, channel_convs = _summary_conversations(client, max_channels)
+
+    # Fetch histories concurrently (network-bound), a few at a time
+    client.my_user_id  # Look up once before the concurrent fetches need it
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        dm_futures = [executor.submit(client.get_messages, conv.id, limit=5, oldest=cutoff) for conv in dm_convs]
+        channel_futures = [executor.submit(client.get_messages, conv.id, limit=50) for conv in channel_convs]
+    dm_messages = [f.result() for f in dm_futures]
+    channel_messages = [f.result() for f in channel_futures]
+
+    return _build_workspace_summary(client, dm_convs, dm_messages, channel_convs, channel_messages)
+
+
+async def summarize_workspace_async(client: SlackClient, hours: int = 24, max_channels: int = 10) -> WorkspaceSummary:
+    """Generate a workspace summary without blocking the event loop.
 
-    # Get all conversations
+    Same result as summarize_workspace; up to MAX_CONCURRENT_FETCHES
+    history requests are in flight at once.
+    """
+    cutoff = time.time() - (hours * 3600)
+
+    # Resolve names and our own user ID before fanning out, so the
+    # concurrent fetches don't race to make the same lookups
+    await asyncio.to_thread(client.prime_user_cache)
+    await asyncio.to_thread(lambda: client.my_user_id)
+
+    dm_convs, channel_convs = await asyncio.to_thread(_summary_conversations, client, max_channels)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch(conv: Conversation, **kwargs) -> list[Message]:
+        async with semaphore:
+            return await asyncio.to_thread(client.get_messages, conv.id, **kwargs)
+
+    dm_messages, channel_messages = await asyncio.gather(
+        asyncio.gather(*(fetch(conv, limit=5, oldest=cutoff) for conv in dm_convs)),
+        asyncio.gather(*(fetch(conv, limit=50) for conv in channel_convs)),
+    )
+
+    return _build_workspace_summary(client, dm_convs, dm_messages, channel_convs, channel_messages)
+
+
+def _summary_conversations(client: SlackClient, max_channels: int) -> tuple[list[Conversation], list[Conversation]]:
+    """Pick the DMs and channels a workspace summary scans."""
     conversations = client.get_conversations()
 
-    # Categorize conversations
-    dm_convs = [c for c in conversations if c.type == "dm"]
-    channel_convs = [c for c in conversations if c.type in ("channel", "group")]
+    # Limit to 10 most recent DMs, and a few channels to avoid rate limits
+    dm_convs = [c for c in conversations if c.type == "dm"][:10]
+    channel_convs = [c for c in conversations if c.type in ("channel", "group")][:max_channels]
+    return dm_convs, channel_convs
+
+
+def _build_workspace_summary(
+    client: SlackClient,
+    dm_convs: list[Conversation],
+    dm_messages: list[list[Message]],
+    channel_convs: list[Conversation],
+    channel_messages: list[list[Message]],
+) -> WorkspaceSummary:
+    """Assemble a WorkspaceSummary from fetched messages (one list per conversation)."""
+    summary = WorkspaceSummary(name=client.workspace.name)
 
-    # Process DMs (limit to 10 most recent, fewer messages)
-    for conv in dm_convs[:10]:
-        messages = client.get_messages(conv.id, limit=5, oldest=cutoff)
+    # Process DMs
+    for conv, messages in zip(dm_convs, dm_messages):
         for msg in messages:
             msg.channel_name = conv.name
         if messages:
             summary.dm_count += len(messages)
             summary.dms.extend(messages)
 
-    # Sort DMs by time
-    summary.dms.sort(key=lambda m: m.ts, reverse=True)
-    summary.dms = summary.dms[:20]  # Keep top 20
+    # Keep the 20 most recent DMs
+    summary.dms = heapq.nlargest(20, summary.dms, key=lambda m: m.ts)
 
     # Skip full mention scan - too expensive. Will catch mentions in channel scan.
     summary.mentions = []
     summary.mention_count = 0
 
-    # Process channels (limit to avoid rate limits)
-    for conv in channel_convs[:max_channels]:
-        messages = client.get_messages(conv.id, limit=50)
-
+    # Process channels
+    my_user_id = client.my_user_id
+    for conv, messages in zip(channel_convs, channel_messages):
         if not messages:
             continue
 
-        # Check for mentions and action items
+        # Check for mentions and action items (only mentions can be action
+        # items, so skip the pattern scan for everything else)
         has_mentions = any(m.is_mention for m in messages)
-        action_items = [m for m in messages if is_action_item(m, client.my_user_id)]
+        action_items = [m for m in messages if m.is_mention and is_action_item(m, my_user_id)]
 
         for msg in messages:
             msg.channel_name = conv.name
@@ -233,7 +313,8 @@ def summarize_workspace(client: SlackClient, hours: int = 24, max_channels: int
     # Sort channels by activity
     summary.channels.sort(key=lambda c: c.message_count, reverse=True)
 
-    # Sort action items and mentions by time
+    # Sort action items and mentions by time (kept whole: the counts and the
+    # action-items-only report use every one)
     summary.action_items.sort(key=lambda m: m.ts, reverse=True)
     summary.mentions.sort(key=lambda m: m.ts, reverse=True)
     summary.mention_count = len(summary.mentions)
@@ -241,82 +322,77 @@ def summarize_workspace(client: SlackClient, hours: int = 24, max_channels: int
     return summary
 
 
-def format_summary_markdown(summaries: list[WorkspaceSummary]) -> str:
-    """Format workspace summaries as markdown."""
+def format_summary_markdown(summaries: list[WorkspaceSummary], out: Optional[TextIO] = None) -> Optional[str]:
+    """Format workspace summaries as markdown.
+
+    Writes to ``out`` if given (e.g. an open file), otherwise returns the
+    markdown as a string.
+    """
+    buf = out if out is not None else io.StringIO()
+    w = buf.write
+
     now = datetime.now(timezone.utc)
-    lines = [
-        f"# Slack Summary - {now.strftime('%B %d, %Y')}",
-        "",
-    ]
+    w(f"# Slack Summary - {now.strftime('%B %d, %Y')}\n\n")
 
     for ws in summaries:
         if len(summaries) > 1:
-            lines.append(f"## {ws.name}")
-            lines.append("")
+            w(f"## {ws.name}\n\n")
 
         # Action Items
         if ws.action_items:
-            lines.append("## Needs Your Attention")
-            lines.append("")
-            lines.append("| From | Channel | Message | Time |")
-            lines.append("|------|---------|---------|------|")
+            w("## Needs Your Attention\n\n")
+            w("| From | Channel | Message | Time |\n")
+            w("|------|---------|---------|------|\n")
             for msg in ws.action_items[:10]:
                 from_name = msg.user_name or "Unknown"
                 text = truncate_text(msg.text, 60)
-                time_str = format_relative_time(msg.timestamp)
-                lines.append(f"| {from_name} | {msg.channel_name} | {text} | {time_str} |")
-            lines.append("")
+                time_str = format_relative_time(msg.timestamp, now)
+                w(f"| {from_name} | {msg.channel_name} | {text} | {time_str} |\n")
+            w("\n")
 
         # Direct Messages
         if ws.dms:
-            lines.append("## Direct Messages")
-            lines.append("")
+            w("## Direct Messages\n\n")
 
             # Group by sender
             by_sender: dict[str, list[Message]] = {}
             for msg in ws.dms:
-                sender = msg.channel_name
-                if sender not in by_sender:
-                    by_sender[sender] = []
-                by_sender[sender].append(msg)
+                by_sender.setdefault(msg.channel_name, []).append(msg)
 
             for sender, messages in list(by_sender.items())[:10]:
                 if len(messages) == 1:
                     text = truncate_text(messages[0].text, 80)
-                    time_str = format_relative_time(messages[0].timestamp)
-                    lines.append(f"- **{sender}** ({time_str}): \"{text}\"")
+                    time_str = format_relative_time(messages[0].timestamp, now)
+                    w(f"- **{sender}** ({time_str}): \"{text}\"\n")
                 else:
-                    lines.append(f"- **{sender}**: {len(messages)} messages")
+                    w(f"- **{sender}**: {len(messages)} messages\n")
                     for msg in messages[:3]:
                         text = truncate_text(msg.text, 60)
-                        time_str = format_relative_time(msg.timestamp)
-                        lines.append(f"  - ({time_str}) \"{text}\"")
+                        time_str = format_relative_time(msg.timestamp, now)
+                        w(f"  - ({time_str}) \"{text}\"\n")
 
-            lines.append("")
+            w("\n")
 
         # Mentions
         if ws.mentions:
-            lines.append("## Mentions")
-            lines.append("")
+            w("## Mentions\n\n")
             for msg in ws.mentions[:10]:
                 from_name = msg.user_name or "Unknown"
                 text = truncate_text(msg.text, 60)
-                time_str = format_relative_time(msg.timestamp)
-                lines.append(f"- **{msg.channel_name}** - {from_name} ({time_str}): \"{text}\"")
-            lines.append("")
+                time_str = format_relative_time(msg.timestamp, now)
+                w(f"- **{msg.channel_name}** - {from_name} ({time_str}): \"{text}\"\n")
+            w("\n")
 
         # Channel Activity
         if ws.channels:
-            lines.append("## Channel Activity")
-            lines.append("")
+            w("## Channel Activity\n\n")
 
             # Split into high and low activity
             high_activity = [c for c in ws.channels if c.message_count >= 10]
             low_activity = [c for c in ws.channels if 0 < c.message_count < 10]
 
             if high_activity:
-                lines.append("### High Activity")
-                lines.append("")
+                w("### High Activity\n\n")
                 for ch in high_activity[:10]:
                     flags = []
                     if ch.has_mentions:
@@ -324,19 +400,19 @@ def format_summary_markdown(summaries: list[WorkspaceSummary]) -> str:
                     if ch.has_action_items:
                         flags.append("needs response")
                     flag_str = f" - *{', '.join(flags)}*" if flags else ""
-                    lines.append(f"- **{ch.name}** ({ch.message_count} messages){flag_str}")
+                    w(f"- **{ch.name}** ({ch.message_count} messages){flag_str}\n")
                     if ch.preview:
-                        lines.append(f"  - Latest: \"{ch.preview}\"")
-                lines.append("")
+                        w(f"  - Latest: \"{ch.preview}\"\n")
+                w("\n")
 
             if low_activity:
-                lines.append("### Low Activity")
-                lines.append("")
+                w("### Low Activity\n\n")
                 for ch in low_activity[:10]:
-                    lines.append(f"- **{ch.name}** ({ch.message_count} messages)")
-                lines.append("")
+                    w(f"- **{ch.name}** ({ch.message_count} messages)\n")
+                w("\n")
 
-        lines.append("---")
-        lines.append("")
+        w("---\n\n")
 
-    return "\n".join(lines)
+    if out is None:
+        return buf.getvalue()
+    return None